@@ -1,5 +1,14 @@
 import numpy as np
 
+def _bits_to_array(bits):
+    """
+    Converte a sequência de bits (string de '0'/'1' ou iterável de inteiros) em um array de 0s e 1s,
+    sem laço Python por bit quando a entrada é uma string.
+    """
+    if isinstance(bits, str):
+        return np.frombuffer(bits.encode('ascii'), dtype=np.uint8) - ord('0')
+    return np.array([int(bit) for bit in bits], dtype=np.uint8)
+
 class DigitalEncoder:
     """Implementa esquemas de codificação de linha (modulação em banda base).
     Atua na Camada Física, convertendo bits digitais em sinais elétricos específicos para transmissão.
@@ -31,11 +40,10 @@ class DigitalEncoder:
 
         O nível do sinal permanece constante durante toda duração do bit, gerando um sinal simples, porém sem autossincronização.
         """
-        signal = []
-        for bit in bits:
-            val = 1.0 if int(bit) == 1 else -1.0
-            signal.extend([val] * samples_per_bit)
-        return np.array(signal)
+        levels = np.where(_bits_to_array(bits) == 1, 1.0, -1.0)
+        signal = np.empty((len(levels), samples_per_bit)) # Buffer pré-alocado: uma linha por bit.
+        signal[:] = levels[:, None]
+        return signal.ravel()
 
     def manchester(self, bits, samples_per_bit=10):
         """
@@ -47,15 +55,11 @@ class DigitalEncoder:
         A mudança de polaridade no meio do bit garante melhor sincronização temporal entre transmissor e receptor.
         """
         half_spb = samples_per_bit // 2
-        signal = []
-        for bit in bits:
-            if int(bit) == 0:
-                signal.extend([1.0] * half_spb)
-                signal.extend([-1.0] * half_spb)
-            else:
-                signal.extend([-1.0] * half_spb)
-                signal.extend([1.0] * half_spb)
-        return np.array(signal)
+        first_half = np.where(_bits_to_array(bits) == 0, 1.0, -1.0)
+        signal = np.empty((len(first_half), 2, half_spb)) # Buffer pré-alocado: duas metades por bit.
+        signal[:, 0, :] = first_half[:, None]
+        signal[:, 1, :] = -first_half[:, None]
+        return signal.ravel()
 
     def bipolar_ami(self, bits, samples_per_bit=10):
         """
@@ -65,12 +69,10 @@ class DigitalEncoder:
 
         Utiliza polaridade alternada nos pulsos para representar bits '1', permitindo detecção de erros por violação de polaridade.
         """
-        signal = []
-        last_pulse_level = -1.0  # Inicializa para que o primeiro pulso seja positivo
-        for bit in bits:
-            if int(bit) == 0:
-                signal.extend([0.0] * samples_per_bit)
-            else:
-                last_pulse_level *= -1.0
-                signal.extend([last_pulse_level] * samples_per_bit)
-        return np.array(signal)
+        bit_values = _bits_to_array(bits)
+        # O k-ésimo bit '1' recebe +1 se k for ímpar e -1 se for par (o primeiro pulso é positivo).
+        pulse_count = np.cumsum(bit_values)
+        levels = np.where(bit_values == 1, np.where(pulse_count % 2 == 1, 1.0, -1.0), 0.0)
+        signal = np.empty((len(levels), samples_per_bit)) # Buffer pré-alocado: uma linha por bit.
+        signal[:] = levels[:, None]
+        return signal.ravel()
@@ -2,6 +2,158 @@
 
 import numpy as np
 import math
+from functools import lru_cache
+
+
+@lru_cache(maxsize=32)
+def _get_carrier(num_samples, freq, sampling_rate):
+    """
+    Gera (e memoriza) as portadoras locais seno e cosseno sobre uma janela de `num_samples` amostras.
+    Como dependem apenas de parâmetros fixos da transmissão, são reaproveitadas entre quadros/pacotes.
+
+    Args:
+        num_samples (int): Número de amostras da janela (um período de bit ou de símbolo).
+        freq (float): Frequência da portadora (Hz).
+        sampling_rate (int): Taxa de amostragem (Hz).
+
+    Returns:
+        np.array: Array float32 somente leitura de forma (2, num_samples): linha 0 = seno, linha 1 = cosseno.
+    """
+    phase = 2 * np.pi * freq * (np.arange(num_samples) / sampling_rate)
+    carrier = np.stack((np.sin(phase), np.cos(phase))).astype(np.float32) # float32: metade da banda de memória.
+    carrier.setflags(write=False) # Protege o cache contra modificações acidentais pelos chamadores.
+    return carrier
+
+@lru_cache(maxsize=16)
+def _get_carrier_exp(num_samples, freq, sampling_rate):
+    """
+    Gera (e memoriza) a portadora complexa exp(j·2π·f·t) = cos + j·sen em complex64 sobre um período de bit ou
+    de símbolo, usada na modulação e demodulação 8-QAM e na demodulação ASK/FSK sem alinhamento de fase.
+
+    Args:
+        num_samples (int): Número de amostras da janela (um período de bit ou de símbolo).
+        freq (float): Frequência da portadora (Hz).
+        sampling_rate (int): Taxa de amostragem (Hz).
+
+    Returns:
+        np.array: Array complex64 somente leitura de comprimento num_samples.
+    """
+    phase = 2 * np.pi * freq * (np.arange(num_samples) / sampling_rate)
+    carrier_exp = np.exp(1j * phase).astype(np.complex64)
+    carrier_exp.setflags(write=False)
+    return carrier_exp
+
+def _period_carriers_exp(num_periods, samples_per_period, freq, sampling_rate):
+    """
+    Portadora complexa de fase contínua vista como matriz (num_periods, samples_per_period): a linha k vale
+    exp(j·2π·f·(k·samples_per_period + m)/fs). Só a base de um período é memorizada; cada linha é essa base
+    girada pela fase inicial do seu período, sem guardar no cache um array do tamanho da mensagem.
+
+    Args:
+        num_periods (int): Número de períodos (bits ou símbolos).
+        samples_per_period (int): Número de amostras por período.
+        freq (float): Frequência da portadora (Hz).
+        sampling_rate (int): Taxa de amostragem (Hz).
+
+    Returns:
+        np.array: Array complex64 de forma (num_periods, samples_per_period).
+    """
+    period_exp = _get_carrier_exp(samples_per_period, freq, sampling_rate)
+    # Fase inicial de cada período, a partir do índice da sua primeira amostra (k·samples_per_period).
+    start_phase = (2 * np.pi * freq * samples_per_period / sampling_rate) * np.arange(num_periods)
+    return np.exp(1j * start_phase).astype(np.complex64)[:, None] * period_exp
+
+def _is_phase_aligned(freq, num_samples, sampling_rate):
+    """
+    Verifica se uma janela de `num_samples` amostras (um período de bit ou de símbolo) contém um número
+    inteiro de ciclos da frequência informada, isto é, se a fase da portadora recomeça em zero a cada janela.
+
+    Args:
+        freq (float): Frequência da portadora (Hz).
+        num_samples (int): Número de amostras da janela.
+        sampling_rate (int): Taxa de amostragem (Hz).
+
+    Returns:
+        bool: True se a portadora estiver alinhada às fronteiras da janela.
+    """
+    cycles = freq * num_samples / sampling_rate
+    return abs(cycles - round(cycles)) < 1e-9
+
+def _correlate_bits(received_signal, carriers, samples_per_bit):
+    """
+    Correlaciona todos os períodos de bit do sinal recebido com uma ou mais portadoras locais de uma vez.
+    O sinal é visto como uma matriz (num_bits, samples_per_bit) e a correlação vira um único produto
+    matricial, executado pela BLAS (fora do GIL) em vez de um laço Python por bit.
+
+    Args:
+        received_signal (np.array): Sinal recebido.
+        carriers (np.array): Portadora(s) locais de forma (samples_per_bit,) ou (k, samples_per_bit).
+        samples_per_bit (int): Número de amostras por período de bit.
+
+    Returns:
+        np.array: Correlações de forma (num_bits,) ou (num_bits, k), conforme `carriers`.
+    """
+    num_bits = len(received_signal) // samples_per_bit
+    segments = np.asarray(received_signal[:num_bits * samples_per_bit]).reshape(num_bits, samples_per_bit)
+    return segments @ np.asarray(carriers).T
+
+def _bits_from_mask(bit_mask):
+    """
+    Converte um array booleano de decisões em uma string de bits ('0'/'1') com uma única operação
+    sobre bytes ASCII, sem criar um objeto Python por bit.
+
+    Args:
+        bit_mask (np.array): Array booleano, True para bit '1'.
+
+    Returns:
+        str: String de bits correspondente.
+    """
+    return (np.asarray(bit_mask, dtype=np.uint8) + ord('0')).tobytes().decode('ascii')
+
+def _qam_decide(points_re, points_im, const_re, const_im):
+    """
+    Decisão por distância mínima para um lote de pontos recebidos.
+    Compara todos os pontos com todos os símbolos da constelação de uma só vez (distância ao quadrado,
+    pois a raiz é monotônica e não altera o vizinho mais próximo).
+
+    Args:
+        points_re (np.array): Componentes em fase (I) dos pontos recebidos.
+        points_im (np.array): Componentes em quadratura (Q) dos pontos recebidos.
+        const_re (np.array): Componentes I dos pontos da constelação.
+        const_im (np.array): Componentes Q dos pontos da constelação.
+
+    Returns:
+        np.array: Índices (uint8) do ponto da constelação mais próximo de cada ponto recebido.
+    """
+    dist_sq = (points_re[:, None] - const_re) ** 2 + (points_im[:, None] - const_im) ** 2
+    return dist_sq.argmin(axis=1).astype(np.uint8)
+
+# Mapeamento da constelação 8-QAM: associa cada símbolo de 3 bits a um ponto complexo (I, Q).
+# Estes pontos definem as combinações de amplitude e fase.
+_INV_SQRT2 = 1 / math.sqrt(2) # Componentes dos pontos diagonais (escalar: math em vez de ufunc NumPy).
+QAM8_MAP = {
+    '000': complex(1, 0),
+    '001': complex(0, 1),
+    '010': complex(-1, 0),
+    '011': complex(0, -1),
+    '100': complex(_INV_SQRT2, _INV_SQRT2),
+    '101': complex(_INV_SQRT2, -_INV_SQRT2),
+    '110': complex(-_INV_SQRT2, _INV_SQRT2),
+    '111': complex(-_INV_SQRT2, -_INV_SQRT2),
+}
+
+def _readonly(array):
+    """Marca um array como somente leitura (tabelas compartilhadas no nível do módulo) e o retorna."""
+    array.setflags(write=False)
+    return array
+
+# Rótulos da constelação como tabela (8, 3) de bytes ASCII, para montar a string de bits demodulada sem laço Python.
+_QAM8_LABEL_BYTES = _readonly(np.frombuffer("".join(QAM8_MAP).encode('ascii'), dtype=np.uint8).reshape(-1, 3).copy())
+# Constelação em arrays paralelos (I, Q), na mesma ordem dos rótulos, usados na decisão vetorizada da demodulação.
+_QAM8_CONST_RE = _readonly(np.array([p.real for p in QAM8_MAP.values()], dtype=np.float32))
+_QAM8_CONST_IM = _readonly(np.array([p.imag for p in QAM8_MAP.values()], dtype=np.float32))
+# Pontos da constelação indexados pelo valor inteiro do símbolo de 3 bits (ex: '101' → 5), usados na modulação.
+_QAM8_POINTS = _readonly(np.array([QAM8_MAP[f'{i:03b}'] for i in range(8)], dtype=np.complex64))
 
 class CarrierModulator:
     """
@@ -26,21 +178,20 @@ class CarrierModulator:
         self.sampling_rate = sampling_rate
         # Calcula o número de amostras por bit para reconstrução precisa da forma de onda.
         self.samples_per_bit = int(sampling_rate / bit_rate)
-
-        # Mapeamento da constelação 8-QAM: associa cada símbolo de 3 bits a um ponto complexo (I, Q).
-        # Estes pontos definem as combinações de amplitude e fase.
-        self.QAM8_MAP = {
-            '000': complex(1, 0),
-            '001': complex(0, 1),
-            '010': complex(-1, 0),
-            '011': complex(0, -1),
-            '100': complex(1/np.sqrt(2), 1/np.sqrt(2)),
-            '101': complex(1/np.sqrt(2), -1/np.sqrt(2)),
-            '110': complex(-1/np.sqrt(2), 1/np.sqrt(2)),
-            '111': complex(-1/np.sqrt(2), -1/np.sqrt(2)),
-        }
-        # Cria um mapeamento reverso para facilitar a busca do símbolo de bits durante a demodulação.
-        self.INV_QAM8_MAP = {v: k for k, v in self.QAM8_MAP.items()}
+        # Incremento de fase da portadora por amostra (rad): a fase da amostra n é n·_phase_step.
+        self._phase_step = 2 * np.pi * carrier_freq / sampling_rate
+        # Portadora de um período de bit, pré-calculada: se a portadora completa um número inteiro de ciclos por bit,
+        # a onda de cada bit é idêntica e a modulação ASK reaproveita este molde em vez de recalcular senos.
+        self._bit_carrier = _get_carrier(self.samples_per_bit, carrier_freq, sampling_rate)[0]
+        self._bit_carrier_aligned = _is_phase_aligned(carrier_freq, self.samples_per_bit, sampling_rate)
+
+        # Mapeamento da constelação 8-QAM e suas tabelas derivadas: constantes do módulo, montadas uma única vez
+        # na importação e compartilhadas por todas as instâncias (o receptor cria uma instância por quadro).
+        self.QAM8_MAP = QAM8_MAP
+        self._label_bytes = _QAM8_LABEL_BYTES
+        self._const_re = _QAM8_CONST_RE
+        self._const_im = _QAM8_CONST_IM
+        self._qam_points = _QAM8_POINTS
 
     def modulate(self, signal_source, modulation_type):
         """
@@ -51,7 +202,7 @@ class CarrierModulator:
             modulation_type (str): O nome do esquema de modulação a ser aplicado (ex: "ASK", "FSK", "8-QAM", "Nenhum").
             
         Returns:
-            tuple: Uma tupla contendo o eixo de tempo (t), o sinal analógico modulado, e uma lista de pontos da constelação (vazia para ASK/FSK).
+            tuple: Uma tupla contendo o eixo de tempo (t), o sinal analógico modulado, e os pontos da constelação (array complex64 para 8-QAM, lista vazia para ASK/FSK).
         
         Raises:
             ValueError: Se o tipo de modulação especificado for desconhecido.
@@ -85,12 +236,24 @@ class CarrierModulator:
         """
         num_bits = len(digital_signal)
         # Cria um eixo de tempo contínuo para o sinal analógico, baseado na taxa de amostragem.
-        t = np.linspace(0, num_bits / self.bit_rate, num_bits * self.samples_per_bit, endpoint=False)
-
-        # Repete os níveis do sinal digital para corresponder ao número de amostras por bit e escala pela amplitude.
-        amplitude_signal = np.repeat(digital_signal * self.amplitude, self.samples_per_bit)
-        carrier = np.sin(2 * np.pi * self.carrier_freq * t) # Gera a onda portadora senoidal.
-        modulated = amplitude_signal * carrier  # Modula a amplitude da portadora com o sinal digital.
+        sample_index = np.arange(num_bits * self.samples_per_bit, dtype=np.float64)
+        t = sample_index / self.sampling_rate # Índice de amostra → tempo (s).
+
+        levels = (np.asarray(digital_signal) * self.amplitude).astype(np.float32)
+        if self._bit_carrier_aligned:
+            # Portadora alinhada às fronteiras de bit: cada período de bit é o molde pré-calculado escalado
+            # pelo nível do bit vezes a amplitude (produto externo), sem nenhum cálculo de seno.
+            modulated = (levels[:, None] * self._bit_carrier).ravel()
+            return t, modulated, []  # ASK não possui diagrama de constelação convencional.
+
+        # Gera a onda portadora senoidal diretamente no buffer de saída (float32), sem arrays intermediários extras.
+        # A fase vem do índice inteiro da amostra (n·2π·fc/fs), calculada no próprio buffer de índices.
+        modulated = np.empty(len(t), dtype=np.float32)
+        sample_index *= self._phase_step
+        np.sin(sample_index, out=modulated, casting='same_kind')
+        # Modula a amplitude da portadora no próprio buffer: cada linha (um período de bit) é escalada
+        # pelo nível do bit vezes a amplitude, por broadcasting (sem np.repeat).
+        modulated.reshape(num_bits, self.samples_per_bit)[...] *= levels[:, None]
         return t, modulated, []  # ASK não possui diagrama de constelação convencional.
 
     def modulate_fsk(self, digital_signal):
@@ -107,19 +270,33 @@ class CarrierModulator:
         """
         num_bits = len(digital_signal)
         # Cria um eixo de tempo contínuo para o sinal analógico.
-        t = np.linspace(0, num_bits / self.bit_rate, num_bits * self.samples_per_bit, endpoint=False)
+        sample_index = np.arange(num_bits * self.samples_per_bit, dtype=np.float64)
+        t = sample_index / self.sampling_rate # Índice de amostra → tempo (s).
 
         f_dev = self.bit_rate  # Define o desvio de frequência para as duas frequências FSK.
         f1 = self.carrier_freq + f_dev # Frequência para representar o bit '1'.
         f0 = self.carrier_freq - f_dev # Frequência para representar o bit '0'.
 
-        modulated = np.zeros_like(t) # Inicializa o array do sinal modulado com zeros.
-        for i, level in enumerate(digital_signal): # Itera sobre cada bit do sinal digital.
-            start_sample = i * self.samples_per_bit # Amostra de início para o período do bit atual.
-            end_sample = (i + 1) * self.samples_per_bit # Amostra de fim para o período do bit atual.
-            freq_to_use = f1 if level == 1 else f0 # Seleciona a frequência com base no valor do bit.
-            # Gera o segmento de onda senoidal para o bit atual e o adiciona ao sinal modulado.
-            modulated[start_sample:end_sample] = self.amplitude * np.sin(2 * np.pi * freq_to_use * t[start_sample:end_sample])
+        bit_is_one = np.asarray(digital_signal) == 1
+        if (_is_phase_aligned(f0, self.samples_per_bit, self.sampling_rate)
+                and _is_phase_aligned(f1, self.samples_per_bit, self.sampling_rate)):
+            # Cada período de bit contém um número inteiro de ciclos de f0 e f1, então a onda de cada bit
+            # é sempre a mesma: basta uma tabela (2, samples_per_bit) e uma indexação pelo valor do bit,
+            # sem calcular seno algum durante a modulação.
+            # Atenção: só é válido com alinhamento de fase nas fronteiras de bit; caso contrário usa o caso geral abaixo.
+            wave_table = self.amplitude * np.stack((_get_carrier(self.samples_per_bit, f0, self.sampling_rate)[0],
+                                                    _get_carrier(self.samples_per_bit, f1, self.sampling_rate)[0]))
+            modulated = wave_table[bit_is_one.astype(np.intp)].ravel()
+            return t, modulated, []  # FSK também não possui diagrama de constelação convencional.
+
+        # Caso geral: incremento de fase por amostra (2π·f1/fs para bits '1', 2π·f0/fs para bits '0') multiplicado
+        # pelo índice inteiro da amostra, no próprio buffer de índices (uma linha por bit, por broadcasting),
+        # e um único cálculo de seno sobre todo o sinal, escrito direto no buffer de saída (float32).
+        phase_step = np.where(bit_is_one, f1, f0) * (2 * np.pi / self.sampling_rate)
+        sample_index.reshape(num_bits, self.samples_per_bit)[...] *= phase_step[:, None]
+        modulated = np.empty(len(t), dtype=np.float32)
+        np.sin(sample_index, out=modulated, casting='same_kind')
+        modulated *= self.amplitude
         return t, modulated, []  # FSK também não possui diagrama de constelação convencional.
 
     def modulate_8qam(self, bits):
@@ -132,36 +309,40 @@ class CarrierModulator:
             bits (str): A string de bits a ser modulada.
             
         Returns:
-            tuple: Eixo de tempo (t), o sinal 8-QAM modulado, e a lista de pontos da constelação gerados.
+            tuple: Eixo de tempo (t), o sinal 8-QAM modulado, e o array (complex64) de pontos da constelação gerados.
         """
-        # Adiciona bits de padding se o comprimento total não for um múltiplo de 3 (para formar símbolos completos).
-        if len(bits) % 3 != 0:
-            bits += '0' * (3 - len(bits) % 3)
-
-        # Divide a string de bits em símbolos de 3 bits.
-        symbols = [bits[i:i+3] for i in range(0, len(bits), 3)]
-        # Mapeia cada símbolo de 3 bits para seu ponto complexo (I, Q) na constelação.
-        qam_points = [self.QAM8_MAP.get(s, complex(0, 0)) for s in symbols]
+        # Buffer de bits (0/1) já do tamanho de símbolos completos: os bits de padding (se o comprimento não for
+        # múltiplo de 3) são os zeros finais do próprio buffer, sem montar uma string/bytes preenchida.
+        num_bits = len(bits)
+        symbol_bits = np.zeros(-(-num_bits // 3) * 3, dtype=np.uint8)
+        symbol_bits[:num_bits] = np.frombuffer(bits.encode('ascii'), dtype=np.uint8)
+        symbol_bits[:num_bits] -= ord('0')
+
+        # Vê o buffer como uma matriz (num_symbols, 3) e calcula o índice inteiro (0..7) de cada símbolo.
+        symbol_bits = symbol_bits.reshape(-1, 3)
+        symbol_indices = symbol_bits[:, 0] * 4 + symbol_bits[:, 1] * 2 + symbol_bits[:, 2]
+        # Mapeia cada símbolo para seu ponto complexo (I, Q) na constelação por indexação inteira (sem buscas no dicionário).
+        symbol_points = self._qam_points[symbol_indices]
 
         # Calcula o número de amostras por símbolo (3 bits por símbolo * amostras por bit).
         samples_per_symbol = self.samples_per_bit * 3
         # Cria o eixo de tempo para o sinal modulado, abrangendo todos os símbolos.
-        t = np.linspace(0, len(symbols) * 3 / self.bit_rate, len(symbols) * samples_per_symbol, endpoint=False)
-        modulated = np.zeros(len(t)) # Inicializa o array do sinal modulado.
-
-        for i, point in enumerate(qam_points): # Itera sobre cada ponto (símbolo) da constelação.
-            start_sample = i * samples_per_symbol # Amostra de início para o símbolo atual.
-            end_sample = (i + 1) * samples_per_symbol # Amostra de fim para o símbolo atual.
-            # Calcula as componentes em fase (I) e em quadratura (Q) escaladas pela amplitude.
-            i_comp = point.real * self.amplitude
-            q_comp = point.imag * self.amplitude
-
-            # Gera as portadoras ortogonais (cosseno para I, seno para Q) para o segmento de tempo atual.
-            cos_carrier = np.cos(2 * np.pi * self.carrier_freq * t[start_sample:end_sample])
-            sin_carrier = np.sin(2 * np.pi * self.carrier_freq * t[start_sample:end_sample])
-            # Combina as componentes I e Q com suas portadoras para formar o sinal 8-QAM.
-            modulated[start_sample:end_sample] = i_comp * cos_carrier - q_comp * sin_carrier
-        return t, modulated, qam_points # Retorna o sinal, o eixo de tempo e os pontos da constelação.
+        t = np.arange(len(symbol_points) * samples_per_symbol, dtype=np.float64) # Índice de amostra → tempo (s).
+        t /= self.sampling_rate
+        if _is_phase_aligned(self.carrier_freq, samples_per_symbol, self.sampling_rate):
+            # A portadora recomeça em fase zero a cada símbolo: a base complexa de um único período de símbolo
+            # (memorizada) vale para todos, e o sinal é o produto externo pontos × base, sem portadora do sinal inteiro.
+            symbol_exp = _get_carrier_exp(samples_per_symbol, self.carrier_freq, self.sampling_rate)
+            modulated = ((symbol_points * np.float32(self.amplitude))[:, None] * symbol_exp).real.ravel()
+            return t, modulated, symbol_points
+        # Portadora complexa exp(j·2π·fc·t) de fase contínua, como matriz (num_symbols, samples_per_symbol).
+        carrier_exp = _period_carriers_exp(len(symbol_points), samples_per_symbol, self.carrier_freq, self.sampling_rate)
+        # Sinal 8-QAM: Re{(I + jQ)·exp(j·2π·fc·t)} = I·cos - Q·sin. Cada linha da portadora é multiplicada pelo
+        # ponto do seu símbolo (escalado pela amplitude) por broadcasting, sem o np.repeat dos pontos.
+        # Toda a aritmética é feita em complex64.
+        scaled_points = symbol_points * np.float32(self.amplitude)
+        modulated = (carrier_exp * scaled_points[:, None]).real.ravel()
+        return t, modulated, symbol_points # Retorna o sinal, o eixo de tempo e os pontos da constelação.
 
     def demodulate(self, received_signal, modulation_type, config, digital_encoder_instance):
         """
@@ -191,17 +372,12 @@ class CarrierModulator:
             # O objetivo aqui é reamostrar e converter esse sinal digital de volta para a string de bits.
             samples_per_bit = int(config["sampling_rate"] / config["bit_rate"])
             num_bits = len(received_signal) // samples_per_bit
-            
-            bits_str = ""
-            for i in range(num_bits):
-                # Amostra o sinal no meio de cada período de bit para determinar o valor do bit.
-                sample_index = i * samples_per_bit + samples_per_bit // 2
-                if sample_index < len(received_signal): # Garante que o índice esteja dentro dos limites.
-                    val = received_signal[sample_index]
-                    bits_str += '1' if val > 0 else '0' # Determina o bit (1 para positivo, 0 para negativo/zero).
-                else: # Em caso de sinal truncado, assume '0' para bits faltantes.
-                    bits_str += '0' 
-            
+
+            # Vê o sinal como matriz (num_bits, samples_per_bit) e amostra todos os bits no meio do período de uma vez.
+            # O bit é '1' para amostra positiva e '0' para negativa/zero.
+            bit_periods = np.asarray(received_signal[:num_bits * samples_per_bit]).reshape(num_bits, samples_per_bit)
+            bits_str = _bits_from_mask(bit_periods[:, samples_per_bit // 2] > 0)
+
             # Reconstrói a forma de onda digital (codificação de linha) usando o DigitalEncoder
             # com os bits recuperados e o tipo de modulação digital original.
             digital_signal_rx = digital_encoder_instance.encode(bits_str, config['mod_digital_type'], samples_per_bit)
@@ -225,24 +401,31 @@ class CarrierModulator:
         Returns:
             tuple: String de bits demodulados, forma de onda digital reconstruída e seu eixo de tempo.
         """
+        received_signal = np.asarray(received_signal, dtype=np.float32) # Processa o sinal em float32.
         bit_rate = config['bit_rate']
         sampling_rate = config['sampling_rate']
         freq_base = config['freq_base']
         mod_digital_type = config.get('mod_digital_type', 'NRZ-Polar')
 
         samples_per_bit = int(sampling_rate / bit_rate)
-        num_bits = len(received_signal) // samples_per_bit
-        t_bit_period = np.linspace(0, 1 / bit_rate, samples_per_bit, endpoint=False) # Eixo de tempo para um período de bit.
-        local_carrier = np.sin(2 * np.pi * freq_base * t_bit_period) # Portadora local para correlação.
+        if _is_phase_aligned(freq_base, samples_per_bit, sampling_rate):
+            local_carrier = _get_carrier(samples_per_bit, freq_base, sampling_rate)[0] # Portadora local para correlação.
 
-        # Limiar de decisão para ASK: metade da energia do sinal de um '1' (assumindo OOK).
-        threshold = self.amplitude * np.sum(local_carrier * local_carrier) / 2.0 
+            # Limiar de decisão para ASK: metade da energia do sinal de um '1' (assumindo OOK).
+            # A energia da portadora é um produto escalar (uma passada, sem array temporário do quadrado).
+            threshold = self.amplitude * float(local_carrier @ local_carrier) / 2.0
 
-        bits = "" # String para armazenar os bits demodulados.
-        for i in range(num_bits): # Processa o sinal segmento por segmento, um para cada bit.
-            segment = received_signal[i * samples_per_bit : (i + 1) * samples_per_bit]
-            correlation = np.sum(segment * local_carrier) # Calcula a correlação do segmento com a portadora local.
-            bits += '1' if correlation > threshold else '0' # Decide o bit com base no limiar.
+            # Correlaciona todos os segmentos (um por bit) com a portadora local, decide pelo limiar e emite os bits de uma vez.
+            bits = _bits_from_mask(_correlate_bits(received_signal, local_carrier, samples_per_bit) > threshold)
+        else:
+            # Sem número inteiro de ciclos por bit, a fase da portadora continua de um bit para o outro (como no
+            # modulador): cada bit tem sua própria portadora local (seno = parte imaginária) e seu próprio limiar.
+            num_bits = len(received_signal) // samples_per_bit
+            bit_carriers = _period_carriers_exp(num_bits, samples_per_bit, freq_base, sampling_rate).imag
+            segments = received_signal[:num_bits * samples_per_bit].reshape(num_bits, samples_per_bit)
+            correlations = np.einsum('ij,ij->i', segments, bit_carriers)
+            thresholds = self.amplitude * np.einsum('ij,ij->i', bit_carriers, bit_carriers) / 2.0
+            bits = _bits_from_mask(correlations > thresholds)
 
         # Reconstrói a forma de onda digital (codificação de linha) usando os bits recuperados.
         digital_signal_rx = digital_encoder_instance.encode(bits, mod_digital_type, samples_per_bit)
@@ -264,27 +447,37 @@ class CarrierModulator:
         Returns:
             tuple: String de bits demodulados, forma de onda digital reconstruída e seu eixo de tempo.
         """
+        received_signal = np.asarray(received_signal, dtype=np.float32) # Processa o sinal em float32.
         bit_rate = config['bit_rate']
         sampling_rate = config['sampling_rate']
         freq_base = config['freq_base']
         mod_digital_type = config.get('mod_digital_type', 'NRZ-Polar')
 
         samples_per_bit = int(sampling_rate / bit_rate)
-        num_bits = len(received_signal) // samples_per_bit
-        t_bit_period = np.linspace(0, 1 / bit_rate, samples_per_bit, endpoint=False) # Eixo de tempo para um período de bit.
 
         f_dev = bit_rate # Desvio de frequência utilizado para as portadoras FSK.
         f1 = freq_base + f_dev # Frequência para o bit '1'.
         f0 = freq_base - f_dev # Frequência para o bit '0'.
-        local_carrier_1 = np.sin(2 * np.pi * f1 * t_bit_period) # Portadora local para '1'.
-        local_carrier_0 = np.sin(2 * np.pi * f0 * t_bit_period) # Portadora local para '0'.
-
-        bits = "" # String para armazenar os bits demodulados.
-        for i in range(num_bits): # Processa o sinal segmento por segmento.
-            segment = received_signal[i * samples_per_bit : (i + 1) * samples_per_bit]
-            correlation_1 = np.sum(segment * local_carrier_1) # Correlação com portadora '1'.
-            correlation_0 = np.sum(segment * local_carrier_0) # Correlação com portadora '0'.
-            bits += '1' if correlation_1 > correlation_0 else '0' # Decide o bit com base na maior correlação.
+        if (_is_phase_aligned(f0, samples_per_bit, sampling_rate)
+                and _is_phase_aligned(f1, samples_per_bit, sampling_rate)):
+            local_carrier_1 = _get_carrier(samples_per_bit, f1, sampling_rate)[0] # Portadora local para '1'.
+            local_carrier_0 = _get_carrier(samples_per_bit, f0, sampling_rate)[0] # Portadora local para '0'.
+
+            # Correlação de todos os segmentos com as duas portadoras: coluna 0 → portadora '0', coluna 1 → portadora '1'.
+            correlations = _correlate_bits(received_signal, np.stack((local_carrier_0, local_carrier_1)), samples_per_bit)
+            bits = _bits_from_mask(correlations[:, 1] > correlations[:, 0]) # Decide cada bit pela maior correlação.
+        else:
+            # Sem alinhamento de fase, o modulador usa a fase contínua de cada frequência: cada bit tem suas
+            # próprias portadoras locais, com energias diferentes. A decisão é pela menor distância ao sinal
+            # esperado, isto é, pela maior correlação descontada de metade da energia (amplitude·E/2).
+            num_bits = len(received_signal) // samples_per_bit
+            segments = received_signal[:num_bits * samples_per_bit].reshape(num_bits, samples_per_bit)
+            scores = []
+            for freq in (f0, f1):
+                bit_carriers = _period_carriers_exp(num_bits, samples_per_bit, freq, sampling_rate).imag
+                scores.append(np.einsum('ij,ij->i', segments, bit_carriers)
+                              - self.amplitude * np.einsum('ij,ij->i', bit_carriers, bit_carriers) / 2.0)
+            bits = _bits_from_mask(scores[1] > scores[0])
 
         # Reconstrói a forma de onda digital (codificação de linha) usando os bits recuperados.
         digital_signal_rx = digital_encoder_instance.encode(bits, mod_digital_type, samples_per_bit)
@@ -305,41 +498,49 @@ class CarrierModulator:
             
         Returns:
             tuple: String de bits demodulados, forma de onda digital reconstruída, seu eixo de tempo,
-                   e a lista de pontos de constelação recebidos (com ruído).
+                   e o array (complex64) de pontos de constelação recebidos (com ruído).
         """
+        received_signal = np.asarray(received_signal, dtype=np.float32) # Processa o sinal em float32.
         bit_rate = config['bit_rate']
         sampling_rate = config['sampling_rate']
         freq_base = config['freq_base']
         samples_per_symbol = int(sampling_rate / bit_rate) * 3 # Amostras por símbolo (3 bits/símbolo).
         num_symbols = len(received_signal) // samples_per_symbol # Número total de símbolos no sinal.
 
-        bits = "" # String para armazenar os bits demodulados.
-        received_qam_points = [] # NOVO: Lista para armazenar os pontos da constelação com ruído.
-
-        for i in range(num_symbols): # Processa o sinal símbolo por símbolo.
-            start_sample = i * samples_per_symbol
-            end_sample = (i + 1) * samples_per_symbol
-            segment = received_signal[start_sample:end_sample]
-            if len(segment) < samples_per_symbol: # Verifica se o segmento está completo.
-                break # Sai do loop se o último segmento estiver incompleto.
+        num_samples = num_symbols * samples_per_symbol # Descarta um eventual último símbolo incompleto.
+        segment = received_signal[:num_samples]
+
+        if _is_phase_aligned(freq_base, samples_per_symbol, sampling_rate):
+            # A portadora recomeça em fase zero a cada símbolo: uma única base complexa de um período de símbolo
+            # serve para todos. Com o sinal visto como matriz (num_symbols, samples_per_symbol), a projeção
+            # I + jQ de todos os símbolos é um único produto matriz-vetor (BLAS).
+            symbol_exp = _get_carrier_exp(samples_per_symbol, freq_base, sampling_rate)
+            iq_components = segment.reshape(num_symbols, samples_per_symbol) @ symbol_exp.conj()
+            # Normalização pela energia da portadora (idêntica para todos os símbolos).
+            symbol_cos = symbol_exp.real
+            normalization_factors = np.full(num_symbols, self.amplitude * (symbol_cos @ symbol_cos), dtype=np.float32)
+        else:
+            # Portadora local complexa com fase contínua ao longo dos símbolos, como matriz (num_symbols, samples_per_symbol).
+            carrier_exp = _period_carriers_exp(num_symbols, samples_per_symbol, freq_base, sampling_rate)
 
-            t_segment = np.linspace(i * 3 / bit_rate, (i + 1) * 3 / bit_rate, samples_per_symbol, endpoint=False) # Eixo de tempo para o segmento.
-            # Portadoras locais ortogonais para projeção I e Q.
-            local_cos_carrier = np.cos(2 * np.pi * freq_base * t_segment)
-            local_sin_carrier = np.sin(2 * np.pi * freq_base * t_segment)
+            # Projeção do sinal recebido nas componentes I e Q: a mistura com exp(-j·2π·fc·t) fornece
+            # s·cos (parte real, I) e -s·sin (parte imaginária, Q) em uma única passada; a integração (soma)
+            # complexa de cada linha, via einsum, produz I + jQ de cada símbolo.
+            symbol_segments = segment.reshape(num_symbols, samples_per_symbol)
+            iq_components = np.einsum('ij,ij->i', symbol_segments, carrier_exp.conj())
 
-            # Projeção do sinal recebido nas componentes I e Q.
-            i_component = np.sum(segment * local_cos_carrier)
-            q_component = np.sum(segment * -local_sin_carrier) # Note o sinal negativo para a componente Q.
-            
             # Normalização das componentes I e Q pela energia da portadora (assumindo portadoras de amplitude 1).
-            normalization_factor = self.amplitude * np.sum(local_cos_carrier**2) # Energia da portadora.
-            received_point = complex(i_component / normalization_factor, q_component / normalization_factor) if normalization_factor > 1e-9 else 0j
-            received_qam_points.append(received_point) # NOVO: Adiciona o ponto recebido (com ruído) à lista.
-            
-            # Encontra o ponto da constelação mais próximo do ponto recebido (detecção por distância mínima).
-            closest_constellation_point = min(self.QAM8_MAP.values(), key=lambda c_point: abs(received_point - c_point))
-            bits += self.INV_QAM8_MAP[closest_constellation_point] # Converte o ponto da constelação de volta para bits.
+            # Energia por símbolo via einsum: soma dos quadrados de cada linha em um único laço, sem o array temporário cos².
+            cos_symbols = carrier_exp.real
+            normalization_factors = self.amplitude * np.einsum('ij,ij->i', cos_symbols, cos_symbols) # Energia da portadora.
+
+        valid = normalization_factors > 1e-9
+        safe_factors = np.where(valid, normalization_factors, np.float32(1.0))
+        received_array = np.where(valid, iq_components / safe_factors, np.complex64(0)).astype(np.complex64)
+
+        # Encontra, para todos os símbolos de uma vez, o ponto da constelação mais próximo (detecção por distância mínima).
+        symbol_indices = _qam_decide(received_array.real, received_array.imag, self._const_re, self._const_im)
+        bits = self._label_bytes[symbol_indices].tobytes().decode('ascii') # Converte os índices de volta para bits.
 
         # Garante que o tamanho final da string de bits não exceda o comprimento original esperado do payload.
         expected_len = config.get('original_payload_len', len(bits))
@@ -350,5 +551,5 @@ class CarrierModulator:
         digital_signal_rx = digital_encoder_instance.encode(bits, mod_digital_type, self.samples_per_bit)
         t_digital = np.arange(len(digital_signal_rx)) / sampling_rate # Eixo de tempo para a forma de onda reconstruída.
         
-        # ALTERAÇÃO: Agora retorna a lista de pontos de constelação ruidosa também.
-        return bits, digital_signal_rx, t_digital, received_qam_points
\ No newline at end of file
+        # ALTERAÇÃO: Agora retorna os pontos de constelação ruidosa também (array complex64).
+        return bits, digital_signal_rx, t_digital, received_array
\ No newline at end of file
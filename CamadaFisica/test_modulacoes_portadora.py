@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from CamadaFisica.modulacoes_digitais import DigitalEncoder
+from CamadaFisica.modulacoes_portadora import CarrierModulator
+
+# (bit_rate, freq_base, sampling_rate): portadora alinhada às fronteiras de bit e um caso desalinhado.
+CONFIGS = [(1000, 5000, 20000), (7, 1.5, 33)]
+MODULATIONS = ['ASK', 'FSK', '8-QAM']
+LINE_CODES = ['NRZ-Polar', 'Manchester', 'Bipolar']
+
+
+def _modulation_input(bits, modulation_type):
+    """Monta a entrada do modulador da mesma forma que o transmissor."""
+    bit_is_one = np.frombuffer(bits.encode('ascii'), dtype=np.uint8) == ord('1')
+    if modulation_type == 'ASK':
+        return bit_is_one.astype(np.float64)
+    if modulation_type == 'FSK':
+        return np.where(bit_is_one, 1.0, -1.0)
+    return bits
+
+
+@pytest.mark.parametrize('bit_rate, freq_base, sampling_rate', CONFIGS)
+@pytest.mark.parametrize('modulation_type', MODULATIONS)
+@pytest.mark.parametrize('line_code', LINE_CODES)
+# 7 e 200 não são múltiplos de 3: no 8-QAM exercitam o preenchimento com zeros do modulador e o corte
+# em original_payload_len do demodulador.
+@pytest.mark.parametrize('num_bits', [3, 7, 200, 201])
+def test_round_trip_sem_ruido(bit_rate, freq_base, sampling_rate, modulation_type, line_code, num_bits):
+    rng = np.random.default_rng(num_bits)
+    bits = ''.join(rng.choice(['0', '1'], num_bits))
+    modulator = CarrierModulator(bit_rate, freq_base, 1.0, sampling_rate)
+    _, signal, _ = modulator.modulate(_modulation_input(bits, modulation_type), modulation_type)
+    config = {
+        'bit_rate': bit_rate,
+        'sampling_rate': sampling_rate,
+        'freq_base': freq_base,
+        'mod_digital_type': line_code,
+        'original_payload_len': len(bits),
+    }
+    received_bits, _, _, _ = modulator.demodulate(np.asarray(signal, dtype=np.float32), modulation_type, config, DigitalEncoder())
+    assert received_bits == bits
@@ -2,19 +2,98 @@
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 import numpy as np
 import threading
-import queue
-import sys
-
-# Permite importação de módulos de um diretório acima, como 'receptor'.
-sys.path.append('../')
+import time
+from collections import deque
 
 # Importa o backend do receptor, responsável pelo processamento das camadas físicas e superiores.
 from Simulador import receptor
 
+# Simplificação de caminhos do Agg: vértices que desviam menos de 1 pixel da reta são descartados antes
+# da rasterização (o padrão é ~0,11 px), reduzindo o custo de desenho das linhas de sinal.
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
+
+# Posição de cada aba de gráfico no notebook (ordem de criação em _create_widgets).
+PLOT_TAB_INDEX = {'pre_demod': 0, 'post_demod': 1, 'constellation_rx': 2}
+
+# Rótulo exibido para cada método de detecção de erro e, quando fixo, o texto do status.
+DETECTION_METHOD_LABELS = {
+    "Nenhuma": ("Detecção de Erro:", "N/A (desativada)"),
+    "Paridade Par": ("Status Paridade:", None),
+    "CRC-32": ("Status CRC-32:", None),
+}
+# Cor do resultado da detecção, pela primeira palavra do status enviado pelo receptor.
+DETECTION_STATUS_COLORS = {"OK": "green", "INVÁLIDO": "red"}
+# Configurações recebidas exibidas na GUI: (chave nos metadados do transmissor, rótulo, formato do valor).
+RECEIVED_CONFIG_FIELDS = (
+    ("enquadramento_type", "Enquadramento:", "{}"),            # Camada de Enlace.
+    ("mod_digital_type", "Mod. Digital:", "{}"),               # Camada Física - banda base.
+    ("mod_portadora_type", "Mod. Portadora:", "{}"),           # Camada Física - passa-faixa.
+    ("detecao_erro_type", "Detecção Erro:", "{}"),             # Camada de Enlace.
+    ("correcao_erro_type", "Correção Erro:", "{}"),            # Camada de Enlace.
+    ("bit_rate", "Taxa de Bits:", "{} bps"),                   # Camada Física.
+    ("freq_base", "Frequência:", "{} Hz"),                     # Frequência da portadora.
+    ("amplitude", "Amplitude:", "{} V"),                       # Amplitude do sinal.
+    ("sampling_rate", "Taxa Amostragem:", "{} sps"),           # Taxa de amostragem.
+    ("taxa_erros", "Taxa de Erros Aplicada:", "{:.3f}"),       # Taxa de erro aplicada no canal (simulação).
+)
+
+# Número máximo de pontos enviados ao Matplotlib por linha: alguns pontos por pixel de largura do gráfico.
+MAX_PLOT_POINTS = 4000
+
+# Intervalos (ms) da verificação periódica da fila: curto enquanto chegam mensagens, longo com o receptor ocioso.
+POLL_INTERVAL_BUSY_MS = 16
+POLL_INTERVAL_IDLE_MS = 500
+
+# Limite inicial dos eixos I/Q da constelação recebida: os pontos chegam normalizados pela amplitude
+# (módulo máximo 1 na constelação 8-QAM), logo a escala não depende da configuração; 50% de margem para o ruído.
+CONST_RX_BASE_LIMIT = 1.5
+
+# Intervalo mínimo (s) entre dois desenhos do mesmo gráfico: ~30 quadros/s, acima disso o olho não distingue.
+MIN_PLOT_INTERVAL_S = 1 / 30
+
+def _downsample_minmax(t, y, max_points):
+    """
+    Reduz um sinal longo para desenho, preservando seu envelope: divide as amostras em blocos consecutivos
+    (no máximo max_points // 2) e mantém o mínimo e o máximo de cada bloco (técnica usada em visualizadores
+    de áudio). Os dois pontos de cada bloco são amostras reais, emitidas na ordem em que ocorrem, para que
+    degraus (drawstyle 'steps-post') mantenham a posição e o sentido das transições.
+    Sinais com até max_points amostras são retornados sem alteração.
+
+    Args:
+        t (np.array): Eixo de tempo.
+        y (np.array): Amostras do sinal.
+        max_points (int): Número máximo de pontos na saída.
+
+    Returns:
+        tuple: (t, y) reduzidos, com no máximo max_points pontos.
+    """
+    n = len(y)
+    if n <= max_points:
+        return t, y
+    block = -(-n // (max_points // 2)) # Amostras por bloco (arredondado para cima).
+    num_full = n // block
+    # Posições do mínimo e do máximo de cada bloco completo, vendo o sinal como matriz (num_full, block).
+    full_blocks = y[:num_full * block].reshape(num_full, block)
+    offsets = np.arange(num_full) * block
+    pos_min = offsets + full_blocks.argmin(axis=1)
+    pos_max = offsets + full_blocks.argmax(axis=1)
+    if num_full * block < n:
+        # Último bloco incompleto.
+        tail = y[num_full * block:]
+        pos_min = np.append(pos_min, num_full * block + tail.argmin())
+        pos_max = np.append(pos_max, num_full * block + tail.argmax())
+    # Intercala os dois extremos de cada bloco em ordem temporal.
+    positions = np.empty(2 * len(pos_min), dtype=np.intp)
+    positions[0::2] = np.minimum(pos_min, pos_max)
+    positions[1::2] = np.maximum(pos_min, pos_max)
+    return t[positions], y[positions]
+
 class ReceptorGUI(ttk.Frame):
     """
     Interface gráfica para o Receptor do simulador de comunicação em camadas.
@@ -36,19 +115,60 @@ class ReceptorGUI(ttk.Frame):
 
         # Fila para troca de mensagens entre thread do backend e thread da interface,
         # evitando travamentos e mantendo a GUI responsiva.
-        self.update_queue = queue.Queue()
+        # deque: append/popleft são atômicos no CPython, suficientes para um produtor e um consumidor.
+        self.update_queue = deque()
+        # Gráficos não passam pela fila: cada aba guarda só os dados mais recentes (protegidos por lock),
+        # de modo que quadros obsoletos são descartados sem acumular memória quando o backend é mais rápido.
+        self._latest_plots = {}
+        self._latest_plots_lock = threading.Lock()
+        # Transmissões anunciadas pelo backend e já limpas na GUI: gráficos só são desenhados quando coincidem.
+        self._plot_generation = 0
+        self._shown_generation = 0
+        # Sinaliza que já há um evento <<QueueUpdate>> pendente, evitando gerar um evento Tk por mensagem.
+        self._queue_signalled = threading.Event()
+        # O backend acorda a thread da GUI com um evento virtual quando publica mensagens (sem polling rápido).
+        self.master.bind('<<QueueUpdate>>', lambda event: self.process_queue())
+
+        # Última cor de texto aplicada a cada rótulo de status: evita reenviar ao Tk a mesma configuração.
+        self._last_fg = {}
+        # Último texto atribuído a cada StringVar de status/configuração (pelo nome Tcl): evita set() redundantes.
+        self._last_text = {}
+        # Dados mais recentes de gráficos cujas abas estavam ocultas, desenhados quando a aba for exibida.
+        self._hidden_plot_data = {}
+        # Instante do último desenho de cada gráfico e se já há um desenho adiado agendado (limite de quadros/s).
+        self._last_plot_time = dict.fromkeys(PLOT_TAB_INDEX, 0.0)
+        self._throttled_flush_scheduled = False
 
         # Criação das variáveis de controle (StringVar) para vincular dados aos widgets da interface.
         self._create_variables()
         # Montagem dos elementos gráficos (widgets) na janela.
         self._create_widgets()
 
+        # Tabelas de despacho das mensagens da fila (montadas uma vez, após a criação dos widgets):
+        # tratadores aplicados imediatamente e, para os status agrupados, o rótulo e a variável de destino.
+        self._message_handlers = {
+            'received_configs': lambda msg: self.update_received_configs(msg['data']),
+            'detection_result': lambda msg: self.update_detection_display(msg['data']),
+            'final_message': lambda msg: self.update_received_message(msg['message']),
+        }
+        self._status_targets = {
+            'connection_status': (self.connection_status_label, self.connection_status_var),
+            'decode_status': (self.decode_status_label, self.decode_status_var),
+            'hamming_status': (self.hamming_status_label, self.hamming_status_var),
+        }
+        # Função de desenho de cada aba de gráfico (usada por dispatch_plot).
+        self._plot_handlers = {
+            'pre_demod': self.plot_pre_demod,
+            'post_demod': self.plot_post_demod,
+            'constellation_rx': self.plot_constellation_rx,
+        }
+
         # Inicia o servidor do receptor em uma thread separada,
         # permitindo a espera por conexões sem bloquear a interface gráfica.
         self.start_listening_thread()
-        # Inicia o processamento assíncrono das atualizações da fila (update_queue)
-        # garantindo que a interface permaneça atualizada conforme a recepção de dados.
-        self.process_queue()
+        # Inicia a verificação periódica (de baixa frequência) da fila como salvaguarda: as atualizações
+        # normalmente chegam pelo evento <<QueueUpdate>>, mas ele pode falhar (ex: antes do mainloop iniciar).
+        self._poll_queue()
 
     def _create_variables(self):
         """
@@ -62,19 +182,17 @@ class ReceptorGUI(ttk.Frame):
         self.detection_status_var = tk.StringVar(value="N/A")                # Resultado da detecção de erro (ex: "OK", "INVÁLIDO").
         self.detection_details_var = tk.StringVar(value="")                  # Informações adicionais sobre detecção (ex: valor CRC).
         self.hamming_status_var = tk.StringVar(value="N/A")                  # Status da correção de erro por código Hamming.
+        self.show_crc_details_var = tk.BooleanVar(value=True)                # Se True, exibe os valores do CRC calculado/recebido.
 
         # Variáveis para exibir configurações de transmissão recebidas como metadados,
-        # incluindo parâmetros das camadas de enlace e física.
-        self.received_enquadramento_var = tk.StringVar(value="N/A")          # Enquadramento (Camada de Enlace).
-        self.received_mod_digital_var = tk.StringVar(value="N/A")            # Modulação digital (Camada Física - banda base).
-        self.received_mod_portadora_var = tk.StringVar(value="N/A")          # Modulação por portadora (Camada Física - passa-faixa).
-        self.received_detecao_erro_var = tk.StringVar(value="N/A")           # Detecção de erro (Camada de Enlace).
-        self.received_correcao_erro_var = tk.StringVar(value="N/A")          # Correção de erro (Camada de Enlace).
-        self.received_bit_rate_var = tk.StringVar(value="N/A")               # Taxa de bits (Camada Física).
-        self.received_freq_var = tk.StringVar(value="N/A")                   # Frequência da portadora (Camada Física).
-        self.received_amplitude_var = tk.StringVar(value="N/A")              # Amplitude do sinal (Camada Física).
-        self.received_sampling_rate_var = tk.StringVar(value="N/A")          # Taxa de amostragem (Camada Física).
-        self.received_error_rate_var = tk.StringVar(value="N/A")             # Taxa de erro aplicada no canal (simulação).
+        # incluindo parâmetros das camadas de enlace e física (uma por chave de RECEIVED_CONFIG_FIELDS).
+        self.received_config_vars = {key: tk.StringVar(value="N/A") for key, _, _ in RECEIVED_CONFIG_FIELDS}
+
+        # Nomes Tcl das variáveis reinicializadas com "..." a cada nova conexão (atribuídas em um único comando Tcl).
+        # Todas as demais escritas nelas passam por _set_var, que mantém _last_text em dia.
+        self._reset_var_names = tuple(str(var) for var in (
+            self.decode_status_var, self.detection_status_var, self.hamming_status_var,
+            *self.received_config_vars.values()))
 
     def _create_widgets(self):
         """
@@ -95,20 +213,9 @@ class ReceptorGUI(ttk.Frame):
         received_config_frame.pack(fill=tk.X, pady=5)
         received_config_frame.grid_columnconfigure(1, weight=1)
 
-        # Lista de pares (label, StringVar) para criar dinamicamente rótulos e valores de configuração.
-        configs = [
-            ("Enquadramento:", self.received_enquadramento_var),
-            ("Mod. Digital:", self.received_mod_digital_var),
-            ("Mod. Portadora:", self.received_mod_portadora_var),
-            ("Detecção Erro:", self.received_detecao_erro_var),
-            ("Correção Erro:", self.received_correcao_erro_var),
-            ("Taxa de Bits:", self.received_bit_rate_var),
-            ("Frequência:", self.received_freq_var),
-            ("Amplitude:", self.received_amplitude_var),
-            ("Taxa Amostragem:", self.received_sampling_rate_var),
-            ("Taxa de Erros Aplicada:", self.received_error_rate_var)
-        ]
-        for i, (label_text, var) in enumerate(configs):
+        # Cria dinamicamente rótulos e valores de configuração a partir de RECEIVED_CONFIG_FIELDS.
+        for i, (key, label_text, _) in enumerate(RECEIVED_CONFIG_FIELDS):
+            var = self.received_config_vars[key]
             ttk.Label(received_config_frame, text=label_text).grid(row=i, column=0, sticky="w", padx=2, pady=1)
             ttk.Label(received_config_frame, textvariable=var, foreground="#333").grid(row=i, column=1, sticky="w", padx=2, pady=1)
 
@@ -129,6 +236,8 @@ class ReceptorGUI(ttk.Frame):
         self.detection_status_label.grid(row=3, column=1, sticky="w", padx=2, pady=1)
         self.detection_details_label = ttk.Label(status_process_frame, textvariable=self.detection_details_var, font=('TkFixedFont', 8), wraplength=350)
         self.detection_details_label.grid(row=4, column=0, columnspan=2, sticky="w", padx=2, pady=1)
+        ttk.Checkbutton(status_process_frame, text="Exibir detalhes do CRC", variable=self.show_crc_details_var,
+                        command=self._on_toggle_crc_details).grid(row=5, column=0, columnspan=2, sticky="w", padx=2, pady=1)
 
         # Frame: mensagem final decodificada (com scrollbar).
         received_msg_frame = ttk.LabelFrame(left_panel, text="Mensagem Final Recebida", padding="10")
@@ -143,49 +252,107 @@ class ReceptorGUI(ttk.Frame):
         # Notebook (abas) para visualização gráfica de diferentes etapas do sinal.
         self.plot_notebook = ttk.Notebook(plot_container_frame)
         self.plot_notebook.pack(fill=tk.BOTH, expand=True)
+        self._tabs_without_toolbar = {}  # Abas (nome do widget → (frame, canvas)) ainda sem barra de ferramentas.
 
+        # Cada gráfico tem artistas persistentes (linha/nuvem de pontos), criados uma única vez:
+        # as atualizações apenas trocam seus dados, sem limpar e recriar o gráfico a cada quadro.
         # Gráfico do sinal recebido no canal (Camada Física).
-        self.ax_pre, self.canvas_pre = self.create_plot_tab("Sinal RX")
+        self.ax_pre, self.canvas_pre = self.create_plot_tab("Sinal RX", xlabel="Tempo (s)", ylabel="Amplitude")
+        self.line_pre, = self.ax_pre.plot([], [], color='blue', linewidth=1)
         # Gráfico dos bits após demodulação (Camada Física - banda base).
-        self.ax_post, self.canvas_post = self.create_plot_tab("Bits RX")
+        self.ax_post, self.canvas_post = self.create_plot_tab("Bits RX", xlabel="Tempo (s)", ylabel="Nível Lógico")
+        self.line_post, = self.ax_post.step([], [], where='post', color='dodgerblue', linewidth=1.2)
+        # Limites dos eixos são definidos explicitamente a cada atualização: sem autoescala sobre os dados.
+        for ax in (self.ax_pre, self.ax_post):
+            ax.set_autoscale_on(False)
         # Gráfico da constelação 8-QAM recebida (para análise de ruído/interferência).
-        self.ax_const_rx, self.canvas_const_rx = self.create_plot_tab("Constelação 8-QAM (RX)", figsize=(8, 6))
-
-    def create_plot_tab(self, name, figsize=(6, 3)):
+        self.ax_const_rx, self.canvas_const_rx = self.create_plot_tab("Constelação 8-QAM (RX)", figsize=(8, 6),
+                                                                      xlabel="Em Fase (I)", ylabel="Quadratura (Q)")
+        # Eixos centrais para referência do plano I/Q, desenhados uma única vez.
+        self.ax_const_rx.axhline(0, color='gray', lw=0.5)
+        self.ax_const_rx.axvline(0, color='gray', lw=0.5)
+        self.ax_const_rx.set_xlim(-CONST_RX_BASE_LIMIT, CONST_RX_BASE_LIMIT)
+        self.ax_const_rx.set_ylim(-CONST_RX_BASE_LIMIT, CONST_RX_BASE_LIMIT)
+        # Limite atual dos eixos I/Q: só cresce durante uma transmissão, mantendo o fundo do blitting válido.
+        self._const_rx_limit = CONST_RX_BASE_LIMIT
+        self.ax_const_rx.set_aspect('equal', 'box')  # Escala igual para ambos os eixos.
+        # Nuvem de pontos animada: atualizada por blitting sobre o fundo do gráfico (eixos, grade) guardado em cache.
+        self.scatter_const_rx = self.ax_const_rx.scatter(np.empty(0), np.empty(0), color='purple', s=40, alpha=0.8,
+                                                         edgecolors='black', linewidths=0.5, animated=True)
+        self._const_rx_background = None
+        self.canvas_const_rx.mpl_connect('draw_event', self._on_const_rx_draw)
+
+        # As barras de ferramentas são criadas só quando a aba é exibida pela primeira vez.
+        self.plot_notebook.bind('<<NotebookTabChanged>>', self._on_plot_tab_changed)
+        self._on_plot_tab_changed()  # Aba inicialmente selecionada.
+
+    def create_plot_tab(self, name, figsize=(6, 3), xlabel="", ylabel=""):
         """
         Cria uma nova aba no notebook de gráficos, associando um gráfico Matplotlib com
-        canvas Tkinter e barra de ferramentas interativa (zoom, pan, salvar).
+        canvas Tkinter. A barra de ferramentas interativa (zoom, pan, salvar) é criada
+        depois, na primeira exibição da aba (ver _on_plot_tab_changed).
         Permite a visualização de diferentes etapas do processamento do sinal.
         
         Args:
             name (str): Nome/título da aba e do gráfico.
             figsize (tuple): Tamanho da figura Matplotlib em polegadas (largura, altura).
+            xlabel (str): Rótulo do eixo X.
+            ylabel (str): Rótulo do eixo Y.
         Returns:
             tuple: (Axes do Matplotlib, FigureCanvasTkAgg do Tkinter)
         """
         tab = ttk.Frame(self.plot_notebook)
         self.plot_notebook.add(tab, text=name)
-        fig, ax = plt.subplots(figsize=figsize)
+        # Figura independente do pyplot: não é registrada no estado global do pyplot nem mantida viva por ele.
+        fig = Figure(figsize=figsize)
+        ax = fig.add_subplot(111)
         canvas = FigureCanvasTkAgg(fig, master=tab)
-        toolbar = NavigationToolbar2Tk(canvas, tab)  # Ferramentas de navegação para análise do gráfico.
-        toolbar.update()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self._tabs_without_toolbar[str(tab)] = (tab, canvas)
+        # Configuração fixa do gráfico (grade e rótulos), feita uma única vez.
+        ax.grid(True, linestyle='--', linewidth=0.5)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
         self.clear_plot_ax(ax, canvas, title=name)
         return ax, canvas
 
+    def _on_plot_tab_changed(self, event=None):
+        """
+        Ao exibir uma aba de gráfico: desenha os dados que chegaram enquanto ela estava oculta e, na primeira
+        exibição, cria sua barra de ferramentas de navegação (zoom, pan, salvar), em vez de inicializar todas
+        as barras na abertura do programa.
+        """
+        current_index = self.plot_notebook.index('current')
+        for plot_tab, index in PLOT_TAB_INDEX.items():
+            if index == current_index and plot_tab in self._hidden_plot_data:
+                self.dispatch_plot(plot_tab, self._hidden_plot_data.pop(plot_tab))
+
+        pending = self._tabs_without_toolbar.pop(str(self.plot_notebook.select()), None)
+        if pending is None:
+            return
+        tab, canvas = pending
+        toolbar = NavigationToolbar2Tk(canvas, tab, pack_toolbar=False)  # Ferramentas de navegação para análise do gráfico.
+        toolbar.update()
+        toolbar.pack(side=tk.BOTTOM, fill=tk.X, before=canvas.get_tk_widget())
+
     def clear_plot_ax(self, ax, canvas, title):
         """
-        Limpa o gráfico (Axes) e prepara para uma nova plotagem, definindo título e grade.
+        Redefine o título do gráfico e agenda seu redesenho. Não usa ax.clear(): grade, rótulos e
+        artistas persistentes são mantidos; os dados dos artistas são trocados por quem chama.
         
         Args:
-            ax (matplotlib.axes.Axes): Eixo do Matplotlib a ser limpo.
+            ax (matplotlib.axes.Axes): Eixo do Matplotlib.
             canvas (FigureCanvasTkAgg): Canvas Tkinter do gráfico.
             title (str): Título a ser definido para o gráfico.
         """
-        ax.clear()
-        ax.set_title(title, fontsize=10)
-        ax.grid(True, linestyle='--', linewidth=0.5)
-        canvas.draw()
+        self._set_title(ax, title)
+        canvas.draw_idle()  # Redesenho adiado: várias atualizações seguidas resultam em um único desenho.
+
+    @staticmethod
+    def _set_title(ax, title):
+        """Define o título do gráfico apenas se ele mudou, evitando refazer o layout do texto a cada quadro."""
+        if ax.get_title() != title:
+            ax.set_title(title, fontsize=10)
 
     def plot_pre_demod(self, data):
         """
@@ -196,23 +363,32 @@ class ReceptorGUI(ttk.Frame):
         Args:
             data (dict): Contém 't' (tempo), 'signal_real' (sinal recebido) e
                         'config' (parâmetros de transmissão para o título).
+                        't' e 'signal_real' devem ser np.ndarray (o receptor envia float32).
         """
+        assert isinstance(data['t'], np.ndarray) and isinstance(data['signal_real'], np.ndarray)
         ax, canvas = self.ax_pre, self.canvas_pre
         # Atualiza o título do gráfico conforme o tipo de modulação por portadora utilizada.
-        self.clear_plot_ax(ax, canvas, f"Sinal Recebido (Pré-Demod) - {data['config']['mod_portadora_type']}")
-        ax.plot(data['t'], data['signal_real'], color='blue', linewidth=1)
-        ax.set_xlabel("Tempo (s)")
-        ax.set_ylabel("Amplitude")
+        self._set_title(ax, f"Sinal Recebido (Pré-Demod) - {data['config']['mod_portadora_type']}")
         
         # Ajusta janela do eixo X para exibir até 2.5 segundos ou o tamanho total do sinal (o que for menor).
         window_duration = 2.5
+        # Só a parte visível do sinal é enviada ao Matplotlib, reduzida por min-max a poucos milhares de pontos:
+        # o custo do desenho passa a depender da largura do gráfico, não do número de amostras.
+        n_show = np.searchsorted(data['t'], window_duration, side='right')
+        # Trecho visível em float32 (o renderizador Agg trabalha em precisão simples); sem cópia se já for float32.
+        t_plot, signal_plot = _downsample_minmax(data['t'][:n_show].astype(np.float32, copy=False),
+                                                 data['signal_real'][:n_show].astype(np.float32, copy=False),
+                                                 MAX_PLOT_POINTS)
+        self.line_pre.set_data(t_plot, signal_plot)  # Troca apenas os dados da linha persistente.
         ax.set_xlim(0, min(window_duration, data['t'][-1] if len(data['t']) > 0 else 1))
         
-        # Garante visibilidade total do sinal no eixo Y, adicionando uma margem ao topo e base.
-        if len(data['signal_real']) > 0:
-            margin = (max(data['signal_real']) - min(data['signal_real'])) * 0.1
-            ax.set_ylim(min(data['signal_real']) - margin, max(data['signal_real']) + margin)
-        canvas.draw()
+        # Garante visibilidade total do trecho exibido no eixo Y, adicionando uma margem ao topo e base.
+        # A redução min-max preserva os extremos, então basta percorrer os poucos pontos já reduzidos.
+        if len(signal_plot) > 0:
+            min_val, max_val = signal_plot.min(), signal_plot.max()
+            margin = (max_val - min_val) * 0.1
+            ax.set_ylim(min_val - margin, max_val + margin)
+        canvas.draw_idle()
 
 
     def plot_post_demod(self, data):
@@ -223,27 +399,33 @@ class ReceptorGUI(ttk.Frame):
         
         Args:
             data (dict): Contém 't' (tempo), 'signal' (níveis digitais), e 'config' (parâmetros para título).
+                        't' e 'signal' devem ser np.ndarray (o receptor envia float32).
         """
+        assert isinstance(data['t'], np.ndarray) and isinstance(data['signal'], np.ndarray)
         ax, canvas = self.ax_post, self.canvas_post
         config = data['config']
         # Define o título conforme o tipo de modulação digital recebida.
-        self.clear_plot_ax(ax, canvas, f"Bits Recuperados ({config['mod_digital_type']})")
-        # Plota a forma de onda digital usando degraus, evidenciando transições de bit.
-        ax.step(data['t'], data['signal'], where='post', color='dodgerblue', linewidth=1.2)
-        ax.set_xlabel("Tempo (s)")
-        ax.set_ylabel("Nível Lógico")
-        
+        self._set_title(ax, f"Bits Recuperados ({config['mod_digital_type']})")
         # Janela do eixo X limitada para visualização detalhada de poucos bits.
         window_duration = 0.05
+        # Forma de onda digital em degraus (linha persistente com drawstyle 'steps-post'), evidenciando transições de bit.
+        # Só as amostras visíveis (mais a primeira após a janela, que fecha o último degrau) vão para o Matplotlib.
+        # Com taxas de amostragem altas, o trecho ainda é reduzido por min-max como no gráfico pré-demodulação.
+        n_show = np.searchsorted(data['t'], window_duration, side='right') + 1
+        t_plot, signal_plot = _downsample_minmax(data['t'][:n_show].astype(np.float32, copy=False),
+                                                 data['signal'][:n_show].astype(np.float32, copy=False),
+                                                 MAX_PLOT_POINTS)
+        self.line_post.set_data(t_plot, signal_plot)
+        
         ax.set_xlim(0, min(window_duration, data['t'][-1] if len(data['t']) > 0 else 1))
         
-        # Ajusta eixo Y para acomodar todos os níveis, adicionando margem visual.
-        if len(data['signal']) > 0:
-            min_val = np.min(data['signal'])
-            max_val = np.max(data['signal'])
-            y_margin = (max_val - min_val) * 0.1 if (max_val - min_val) > 0 else 0.2
+        # Ajusta eixo Y para acomodar os níveis do trecho exibido, adicionando margem visual.
+        if len(signal_plot) > 0:
+            min_val, max_val = signal_plot.min(), signal_plot.max()
+            value_range = max_val - min_val
+            y_margin = value_range * 0.1 if value_range > 0 else 0.2
             ax.set_ylim(min_val - y_margin, max_val + y_margin)
-        canvas.draw()
+        canvas.draw_idle()
 
     def plot_constellation_rx(self, plot_data):
         """
@@ -251,65 +433,117 @@ class ReceptorGUI(ttk.Frame):
         causada por ruído/interferências no canal. Permite análise visual da qualidade da transmissão.
         
         Args:
-            plot_data (dict): Contém 'points', lista de símbolos complexos (I + jQ).
+            plot_data (dict): Contém 'points', array de símbolos complexos (I + jQ).
         """
         ax, canvas = self.ax_const_rx, self.canvas_const_rx
-        points = plot_data['points']
-        self.clear_plot_ax(ax, canvas, "Constelação 8-QAM Recebida (com Ruído)")
-        real = [p.real for p in points]  # Eixo I (em fase)
-        imag = [p.imag for p in points]  # Eixo Q (quadratura)
-        ax.scatter(real, imag, color='purple', s=40, alpha=0.8, edgecolors='black', linewidths=0.5)
-        
-        # Eixos centrais para referência do plano I/Q.
-        ax.axhline(0, color='gray', lw=0.5)
-        ax.axvline(0, color='gray', lw=0.5)
-        ax.set_xlabel("Em Fase (I)")
-        ax.set_ylabel("Quadratura (Q)")
+        points = np.asarray(plot_data['points'], dtype=np.complex64)
+        real = points.real  # Eixo I (em fase)
+        imag = points.imag  # Eixo Q (quadratura)
+        self.scatter_const_rx.set_offsets(np.column_stack((real, imag)))  # Troca apenas as posições da nuvem.
         
-        # Ajuste automático dos limites dos eixos, garantindo exibição de todos pontos e o centro.
-        all_coords = real + imag
-        if all_coords:
-            max_abs_val = max(abs(val) for val in all_coords)
-            limit = max_abs_val * 1.5
+        # Limites fixos durante a transmissão, ampliados apenas se algum ponto ruidoso sair da área visível:
+        # os eixos (e o fundo em cache) deixam de mudar a cada quadro e a nuvem é atualizada por blitting.
+        if points.size:
+            max_abs_val = max(np.abs(real).max(), np.abs(imag).max())
+            self._const_rx_limit = max(self._const_rx_limit, max_abs_val * 1.5)
+        limit = self._const_rx_limit
+        title = "Constelação 8-QAM Recebida (com Ruído)"
+        if ax.get_xlim() != (-limit, limit) or ax.get_title() != title:
+            # Limites ou título mudaram: o fundo em cache ficou inválido e o gráfico precisa de um desenho completo.
             ax.set_xlim(-limit, limit)
             ax.set_ylim(-limit, limit)
+            self._set_title(ax, title)
+            canvas.draw_idle()
         else:
-            ax.set_xlim(-1.5, 1.5)
-            ax.set_ylim(-1.5, 1.5)
-        ax.set_aspect('equal', 'box')  # Escala igual para ambos os eixos.
-        canvas.draw()
+            self._blit_constellation_rx()
+
+    def _on_const_rx_draw(self, event):
+        """
+        Executado após cada desenho completo do gráfico de constelação: guarda o fundo (eixos, grade,
+        título, sem a nuvem animada) para o blitting e desenha a nuvem de pontos por cima.
+        """
+        self._const_rx_background = self.canvas_const_rx.copy_from_bbox(self.ax_const_rx.bbox)
+        self.ax_const_rx.draw_artist(self.scatter_const_rx)
+
+    def _blit_constellation_rx(self):
+        """
+        Redesenha apenas a nuvem de pontos da constelação: restaura o fundo em cache, desenha o artista
+        animado e copia só a área dos eixos para a tela, sem re-renderizar a figura inteira.
+        """
+        if self._const_rx_background is None:
+            self.canvas_const_rx.draw_idle()  # Ainda não houve desenho completo para servir de fundo.
+            return
+        self.canvas_const_rx.restore_region(self._const_rx_background)
+        self.ax_const_rx.draw_artist(self.scatter_const_rx)
+        self.canvas_const_rx.blit(self.ax_const_rx.bbox)
 
     def process_queue(self):
         """
         Processa todas as mensagens da fila de atualização, garantindo comunicação segura
         entre a thread de backend (receptor) e a thread da GUI. 
         Fundamental para integração em aplicações Tkinter multi-thread.
-        """
-        try:
-            while not self.update_queue.empty():
-                msg = self.update_queue.get_nowait()
-                msg_type = msg.get('type')
 
-                # Despacha cada tipo de mensagem para a função correspondente na interface.
-                if msg_type == 'new_connection':
-                    self.clear_all_for_new_connection(msg['address'])
-                elif msg_type == 'connection_status':
-                    self.update_status_var(self.connection_status_label, self.connection_status_var, msg)
-                elif msg_type == 'decode_status':
-                    self.update_status_var(self.decode_status_label, self.decode_status_var, msg)
-                elif msg_type == 'hamming_status':
-                    self.update_status_var(self.hamming_status_label, self.hamming_status_var, msg)
-                elif msg_type == 'received_configs':
-                    self.update_received_configs(msg['data'])
-                elif msg_type == 'detection_result':
-                    self.update_detection_display(msg['data'])
-                elif msg_type == 'final_message':
-                    self.update_received_message(msg['message'])
-                elif msg_type == 'plot':
-                    self.dispatch_plot(msg['tab'], msg['data'])
+        As mensagens acumuladas desde o último ciclo são agrupadas: de cada aba de gráfico e de cada
+        tipo de status só a mais recente é aplicada (as anteriores seriam sobrescritas de qualquer forma),
+        de modo que uma rajada de mensagens custa no máximo um redesenho por gráfico.
+
+        Returns:
+            bool: True se alguma mensagem ou gráfico foi processado neste ciclo.
+        """
+        # Limpa o sinal antes de esvaziar a fila: mensagens publicadas durante o processamento geram novo evento.
+        self._queue_signalled.clear()
+        pending_status = {}  # Última mensagem de cada tipo de status (conexão, decodificação, Hamming).
+        handled_messages = 0
+        while self.update_queue:
+            try:
+                msg = self.update_queue.popleft()
+            except IndexError:
+                break
+            msg_type = msg.get('type')
+            handled_messages += 1
+
+            # Despacha cada tipo de mensagem para a função correspondente na interface.
+            if msg_type == 'new_connection':
+                # Status pendentes pertencem à transmissão anterior, que será limpa.
+                pending_status.clear()
+                self._shown_generation += 1
+                self.clear_all_for_new_connection(msg['address'])
+            elif msg_type in self._status_targets:
+                pending_status[msg_type] = msg
+            else:
+                handler = self._message_handlers.get(msg_type)
+                if handler is not None:
+                    handler(msg)
+
+        # Recolhe os últimos dados de cada aba. Se um 'new_connection' chegou depois do esvaziamento da fila,
+        # os gráficos já são da nova transmissão e aguardam o próximo ciclo (que a limpará antes de desenhá-los).
+        with self._latest_plots_lock:
+            if self._plot_generation == self._shown_generation:
+                pending_plots, self._latest_plots = self._latest_plots, {}
+            else:
+                pending_plots = {}
+
+        # Aplica uma única vez o estado mais recente de cada status e de cada gráfico.
+        for msg_type, msg in pending_status.items():
+            label, var = self._status_targets[msg_type]
+            self.update_status_var(label, var, msg)
+        for tab, data in pending_plots.items():
+            self.dispatch_plot(tab, data)
+        return bool(handled_messages or pending_plots)
+
+    def _poll_queue(self):
+        """
+        Verificação periódica de salvaguarda da fila de atualização, para o caso de algum evento
+        <<QueueUpdate>> não ter sido entregue. O intervalo é adaptativo: ~16 ms enquanto a última
+        verificação encontrou mensagens e 500 ms com o receptor ocioso (único despertar da GUI nesse caso).
+        """
+        interval = POLL_INTERVAL_IDLE_MS
+        try:
+            if self.process_queue():
+                interval = POLL_INTERVAL_BUSY_MS
         finally:
             # Agenda a próxima verificação da fila; mantém o loop de atualização da GUI.
-            self.master.after(100, self.process_queue)
+            self.master.after(interval, self._poll_queue)
 
     def update_detection_display(self, data):
         """
@@ -318,41 +552,39 @@ class ReceptorGUI(ttk.Frame):
         """
         method = data.get('method')
         status = data.get('status')
-        color = "green" if "OK" in status else "red" if "INVÁLIDO" in status else "black"
-        self.detection_details_var.set("")
 
-        if method == "Nenhuma":
-            self.detection_method_var.set("Detecção de Erro:")
-            self.detection_status_var.set("N/A (desativada)")
-            self.detection_status_label.config(foreground="black")
-        elif method == "Paridade Par":
-            self.detection_method_var.set("Status Paridade:")
-            self.detection_status_var.set(status)
-            self.detection_status_label.config(foreground=color)
-        elif method == "CRC-32":
-            self.detection_method_var.set("Status CRC-32:")
-            self.detection_status_var.set(status)
-            self.detection_status_label.config(foreground=color)
-            calc = data.get('calc')
-            recv = data.get('recv')
-            # Exibe valores binários do CRC calculado e recebido.
-            details_text = f"Calculado: 0b{calc:032b}\nRecebido:  0b{recv:032b}"
-            self.detection_details_var.set(details_text)
+        labels = DETECTION_METHOD_LABELS.get(method)
+        if labels is not None:
+            method_text, fixed_status = labels
+            self.detection_method_var.set(method_text)
+            if fixed_status is not None:
+                # Detecção desativada: texto fixo, sem cor de resultado.
+                self._set_var(self.detection_status_var, fixed_status)
+                self._set_foreground(self.detection_status_label, "black")
+            else:
+                self._set_var(self.detection_status_var, status)
+                # A primeira palavra do status ("OK", "INVÁLIDO", ...) define a cor do resultado.
+                self._set_foreground(self.detection_status_label, DETECTION_STATUS_COLORS.get(status.split(' ', 1)[0], "black"))
+        if not self.show_crc_details_var.get():
+            return  # Detalhes ocultos pelo usuário: nada a atualizar no rótulo.
+        # Detalhes (ex: CRC calculado/recebido) já chegam formatados pela thread do receptor.
+        self.detection_details_var.set(data.get('details', ""))
+
+    def _on_toggle_crc_details(self):
+        """Limpa os detalhes do CRC ao desativar sua exibição; reaparecem no próximo pacote."""
+        if not self.show_crc_details_var.get():
+            self.detection_details_var.set("")
 
     def clear_all_for_new_connection(self, address):
         """
         Reinicializa todos os campos e gráficos da GUI para novo ciclo de transmissão.
         Fundamental para manter o isolamento entre execuções/simulações.
         """
-        self.connection_status_var.set(f"Conexão de {address}")
-        self.connection_status_label.config(foreground='green')
-        for var in [self.decode_status_var, self.detection_status_var, self.hamming_status_var,
-                    self.received_enquadramento_var, self.received_mod_digital_var,
-                    self.received_mod_portadora_var, self.received_detecao_erro_var,
-                    self.received_correcao_erro_var, self.received_bit_rate_var,
-                    self.received_freq_var, self.received_amplitude_var,
-                    self.received_sampling_rate_var, self.received_error_rate_var]:
-            var.set("...")
+        self._set_var(self.connection_status_var, f"Conexão de {address}")
+        self._set_foreground(self.connection_status_label, 'green')
+        # Um único 'foreach' no interpretador Tcl em vez de uma chamada por StringVar.
+        self.tk.call('foreach', 'v', self._reset_var_names, 'set ::$v ...')
+        self._last_text.update(dict.fromkeys(self._reset_var_names, "..."))
         self.detection_method_var.set("Detecção:")
         self.detection_details_var.set("")
 
@@ -360,7 +592,14 @@ class ReceptorGUI(ttk.Frame):
         self.received_message_text.delete(1.0, tk.END)
         self.received_message_text.config(state="disabled")
 
-        # Limpa todos os gráficos para a nova rodada.
+        # Limpa os dados de todos os gráficos para a nova rodada (os artistas persistentes são mantidos).
+        self._hidden_plot_data.clear()
+        self.line_pre.set_data([], [])
+        self.line_post.set_data([], [])
+        self.scatter_const_rx.set_offsets(np.empty((0, 2)))
+        self._const_rx_limit = CONST_RX_BASE_LIMIT
+        self.ax_const_rx.set_xlim(-CONST_RX_BASE_LIMIT, CONST_RX_BASE_LIMIT)
+        self.ax_const_rx.set_ylim(-CONST_RX_BASE_LIMIT, CONST_RX_BASE_LIMIT)
         for ax, canvas, title in [
             (self.ax_pre, self.canvas_pre, "Sinal RX"),
             (self.ax_post, self.canvas_post, "Bits RX"),
@@ -392,51 +631,102 @@ class ReceptorGUI(ttk.Frame):
         Callback thread-safe para envio de mensagens da thread backend à thread principal (GUI).
         Integração essencial em aplicações multi-thread Tkinter.
         """
-        self.update_queue.put(msg)
+        msg_type = msg.get('type')
+        if msg_type == 'plot':
+            # Substitui o quadro ainda não desenhado da mesma aba, em vez de enfileirar mais um.
+            with self._latest_plots_lock:
+                self._latest_plots[msg['tab']] = msg['data']
+        else:
+            with self._latest_plots_lock:
+                if msg_type == 'new_connection':
+                    # Gráficos ainda não desenhados pertencem à transmissão anterior.
+                    self._plot_generation += 1
+                    self._latest_plots.clear()
+                # Enfileirado sob o lock para que a ordem na fila acompanhe a contagem de transmissões.
+                self.update_queue.append(msg)
+        if not self._queue_signalled.is_set():
+            self._queue_signalled.set()
+            try:
+                # Acorda a thread da GUI; o Tkinter repassa a chamada ao loop principal de forma segura.
+                self.master.event_generate('<<QueueUpdate>>', when='tail')
+            except (RuntimeError, tk.TclError):
+                # Loop principal ainda não iniciado (ou janela fechando): a verificação periódica assume.
+                pass
 
     def update_status_var(self, label, var, msg):
         """
         Atualiza rótulo de status e sua cor visual conforme mensagem recebida.
         Útil para feedback de eventos como conexão, decodificação e correção de erro.
         """
-        var.set(msg['message'])
-        label.config(foreground=msg['color'])
+        self._set_var(var, msg['message'])
+        self._set_foreground(label, msg['color'])
+
+    def _set_var(self, var, value):
+        """
+        Atribui o valor a uma StringVar apenas se ele mudou desde a última vez, evitando
+        disparar os traces do Tk e o redesenho do rótulo quando o texto é o mesmo.
+        """
+        name = str(var)
+        if self._last_text.get(name) != value:
+            var.set(value)
+            self._last_text[name] = value
+
+    def _set_foreground(self, label, color):
+        """
+        Aplica a cor do texto de um rótulo apenas se ela mudou desde a última vez,
+        evitando um comando Tcl redundante a cada atualização de status.
+        """
+        if self._last_fg.get(label) != color:
+            label.config(foreground=color)
+            self._last_fg[label] = color
 
     def dispatch_plot(self, tab, data):
         """
         Redireciona o comando de plotagem para a função apropriada, conforme aba ativa.
         Facilita modularização dos tipos de gráficos exibidos na GUI.
-        """
-        if tab == 'pre_demod':
-            self.plot_pre_demod(data)
-        elif tab == 'post_demod':
-            self.plot_post_demod(data)
-        elif tab == 'constellation_rx':
-            self.plot_constellation_rx(data)
+        Gráficos de abas ocultas não são desenhados: apenas seus dados mais recentes são guardados
+        e desenhados quando a aba for exibida (ver _on_plot_tab_changed).
+        """
+        if self.plot_notebook.index('current') != PLOT_TAB_INDEX.get(tab):
+            self._hidden_plot_data[tab] = data
+            return
+        now = time.monotonic()
+        wait = self._last_plot_time.get(tab, 0.0) + MIN_PLOT_INTERVAL_S - now
+        if wait > 0:
+            # Gráfico desenhado há menos de 1/30 s: os dados voltam ao slot da aba (salvo se já chegaram outros
+            # mais novos) e são desenhados quando o intervalo mínimo terminar. Se uma nova conexão chegou nesse
+            # meio-tempo, os dados são da transmissão anterior e são descartados.
+            with self._latest_plots_lock:
+                if self._plot_generation == self._shown_generation:
+                    self._latest_plots.setdefault(tab, data)
+            if not self._throttled_flush_scheduled:
+                self._throttled_flush_scheduled = True
+                self.master.after(int(wait * 1000) + 1, self._flush_throttled_plots)
+            return
+        self._last_plot_time[tab] = now
+        handler = self._plot_handlers.get(tab)
+        if handler is not None:
+            handler(data)
+
+    def _flush_throttled_plots(self):
+        """Desenha os gráficos adiados pelo limite de quadros por segundo (ver dispatch_plot)."""
+        self._throttled_flush_scheduled = False
+        self.process_queue()
 
     def update_received_configs(self, data):
         """
         Atualiza variáveis de configuração da GUI com as informações do transmissor (metadados do experimento).
         Reflete parâmetros reais das camadas Física e Enlace.
         """
-        self.received_enquadramento_var.set(data.get("enquadramento_type"))
-        self.received_mod_digital_var.set(data.get("mod_digital_type"))
-        self.received_mod_portadora_var.set(data.get("mod_portadora_type"))
-        self.received_detecao_erro_var.set(data.get("detecao_erro_type"))
-        self.received_correcao_erro_var.set(data.get("correcao_erro_type"))
-        self.received_bit_rate_var.set(f"{data.get('bit_rate')} bps")
-        self.received_freq_var.set(f"{data.get('freq_base')} Hz")
-        self.received_amplitude_var.set(f"{data.get('amplitude')} V")
-        self.received_sampling_rate_var.set(f"{data.get('sampling_rate')} sps")
-        self.received_error_rate_var.set(f"{data.get('taxa_erros'):.3f}")
+        for key, _, value_format in RECEIVED_CONFIG_FIELDS:
+            self._set_var(self.received_config_vars[key], value_format.format(data.get(key)))
 
     def update_received_message(self, message):
         """
         Atualiza
         """
         self.received_message_text.config(state="normal") # Habilita temporariamente a área de texto para edição.
-        self.received_message_text.delete(1.0, tk.END) # Limpa qualquer conteúdo existente na área de texto.
-        self.received_message_text.insert(tk.END, message) # Insere a nova mensagem decodificada.
+        self.received_message_text.replace("1.0", tk.END, message) # Substitui o conteúdo existente pela nova mensagem em uma única chamada.
         self.received_message_text.config(state="disabled") # Desabilita a área de texto novamente para evitar edição pelo usuário.
 
 if __name__ == '__main__':
@@ -1,19 +1,18 @@
 import tkinter as tk
 from tkinter import ttk
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 import numpy as np
 import threading
-import queue
-import sys
-
-# Permite importação de módulos do diretório pai, como 'transmissor' e 'utils'.
-sys.path.append('../')
+from collections import deque
+import logging
 
 # Importa lógica de transmissão e utilitários de conversão binário/texto.
 from Simulador import transmissor
 from Utilidades import utils
 
+logger = logging.getLogger(__name__)
+
 class TransmissorGUI(ttk.Frame):
     """
     Interface gráfica do Transmissor para o simulador de camadas de rede.
@@ -33,7 +32,8 @@ class TransmissorGUI(ttk.Frame):
         self.pack(fill=tk.BOTH, expand=True)
 
         # Fila para comunicação segura entre threads; backend envia atualizações para GUI.
-        self.update_queue = queue.Queue()
+        # deque: append/popleft são atômicos no CPython, sem o lock e a Condition de queue.Queue por mensagem.
+        self.update_queue = deque()
 
         # Variáveis de controle para configuração e entrada da transmissão.
         self.msg_var = tk.StringVar(value="00000") # Mensagem a ser transmitida (binário/texto).
@@ -166,7 +166,9 @@ class TransmissorGUI(ttk.Frame):
         """
         tab = ttk.Frame(self.plot_notebook)
         self.plot_notebook.add(tab, text=tab_name)
-        fig, ax = plt.subplots(figsize=figsize)
+        # Figure explícita (sem pyplot): não fica registrada no gerenciador global de figuras.
+        fig = Figure(figsize=figsize)
+        ax = fig.add_subplot(111)
         fig.tight_layout(pad=2.5)
         canvas = FigureCanvasTkAgg(fig, master=tab)
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
@@ -193,7 +195,7 @@ class TransmissorGUI(ttk.Frame):
         # Fase de codificação de fonte: identifica se a entrada é binária pura ou texto.
         if self.raw_binary_input.get():
             # Validação de entrada: apenas '0' e '1' permitidos em modo binário puro.
-            if not all(bit in '01' for bit in message_input):
+            if not utils.is_binary_string(message_input):
                 self.status_label.config(
                     text="ERRO: Entrada binária pura deve conter apenas '0's e '1's.", foreground="red"
                 )
@@ -233,7 +235,7 @@ class TransmissorGUI(ttk.Frame):
         Args:
             update_dict (dict): Dicionário com o tipo de atualização e dados associados.
         """
-        self.update_queue.put(update_dict)
+        self.update_queue.append(update_dict)
 
     def process_queue(self):
         """
@@ -242,8 +244,8 @@ class TransmissorGUI(ttk.Frame):
         garante atualização assíncrona, segura e responsiva da interface.
         """
         try:
-            while not self.update_queue.empty():
-                msg = self.update_queue.get_nowait()
+            while self.update_queue:
+                msg = self.update_queue.popleft()
                 msg_type = msg.get('type')
 
                 # Direciona a mensagem para o método apropriado conforme o tipo.
@@ -304,18 +306,20 @@ class TransmissorGUI(ttk.Frame):
         ax, canvas = self.ax_digital, self.canvas_digital
         t, signal, config = plot_data['t'], plot_data['signal'], plot_data['config']
         
-        # DEBUG: Análise do sinal digital gerado.
-        print(f"DEBUG: update_digital_plot - Tipo de Modulação Digital: {config['mod_digital_type']}")
-        print(f"DEBUG: update_digital_plot - Comprimento do sinal: {len(signal)}")
-        print(f"DEBUG: update_digital_plot - Primeiros 10 valores do sinal: {signal[:10]}")
-        print(f"DEBUG: update_digital_plot - Últimos 10 valores do sinal: {signal[-10:]}")
-        if len(signal) > 0 and config['mod_digital_type'] == 'NRZ-Polar':
-            unique_vals = np.unique(signal)
-            print(f"DEBUG: update_digital_plot - Valores únicos no sinal: {unique_vals}")
-            if len(unique_vals) == 1 and unique_vals[0] == -1.0:
-                print("DEBUG: O array do sinal é plano em -1.0 como esperado para '0's em NRZ-Polar.")
-            else:
-                print("DEBUG: O array do sinal NÃO é plano em -1.0. Contém variações.")
+        # DEBUG: Análise do sinal digital gerado. Só é formatada (e o np.unique calculado) se o nível DEBUG estiver ativo,
+        # evitando print() síncrono a cada atualização do gráfico.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"update_digital_plot - Tipo de Modulação Digital: {config['mod_digital_type']}")
+            logger.debug(f"update_digital_plot - Comprimento do sinal: {len(signal)}")
+            logger.debug(f"update_digital_plot - Primeiros 10 valores do sinal: {signal[:10]}")
+            logger.debug(f"update_digital_plot - Últimos 10 valores do sinal: {signal[-10:]}")
+            if len(signal) > 0 and config['mod_digital_type'] == 'NRZ-Polar':
+                unique_vals = np.unique(signal)
+                logger.debug(f"update_digital_plot - Valores únicos no sinal: {unique_vals}")
+                if len(unique_vals) == 1 and unique_vals[0] == -1.0:
+                    logger.debug("O array do sinal é plano em -1.0 como esperado para '0's em NRZ-Polar.")
+                else:
+                    logger.debug("O array do sinal NÃO é plano em -1.0. Contém variações.")
         # ---
 
         self.clear_plot_ax(ax, canvas, f"Sinal Digital ({config['mod_digital_type']})")
@@ -364,16 +368,16 @@ class TransmissorGUI(ttk.Frame):
         Cada ponto representa um símbolo transmitido no plano I (Em Fase) e Q (Quadratura).
 
         Args:
-            plot_data (dict): Contém 'points' (lista de números complexos representando a constelação).
+            plot_data (dict): Contém 'points' (array de números complexos representando a constelação).
         """
         ax, canvas = self.ax_const, self.canvas_const
-        points = plot_data['points']
+        points = np.asarray(plot_data['points'], dtype=np.complex64)
         self.clear_plot_ax(ax, canvas, "Constelação 8-QAM (TX)")
 
 
         # Separa os pontos em suas componentes de fase (I) e quadratura (Q).
-        real = [p.real for p in points]
-        imag = [p.imag for p in points]
+        real = points.real
+        imag = points.imag
         ax.scatter(real, imag, color='purple', s=40, alpha=0.8)
 
 
@@ -384,9 +388,8 @@ class TransmissorGUI(ttk.Frame):
         ax.set_ylabel("Quadratura (Q)")
 
         # Ajusta limites dos eixos para abranger todos os pontos e a origem, com margem visual.
-        all_coords = real + imag
-        if all_coords:
-            max_abs_val = max(abs(val) for val in all_coords)
+        if points.size:
+            max_abs_val = max(np.abs(real).max(), np.abs(imag).max())
             limit = max_abs_val * 1.2
             ax.set_xlim(-limit, limit)
             ax.set_ylim(-limit, limit)
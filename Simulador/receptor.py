@@ -1,7 +1,6 @@
 # Simulador/receptor.py
 
 import socket
-import sys
 import numpy as np
 import time
 import logging
@@ -11,9 +10,6 @@ import time as time_module
 logging.getLogger('matplotlib.font_manager').setLevel(logging.WARNING)
 logging.getLogger('PIL.PngImagePlugin').setLevel(logging.WARNING)
 
-# Permite importação de módulos locais e de outras pastas do projeto.
-sys.path.append('../')
-
 from Utilidades import utils
 from CamadaEnlace.deteccao_erros import ErrorDetector
 from CamadaEnlace.correcao_erros import ErrorCorrector
@@ -26,6 +22,9 @@ HOST = '127.0.0.1'
 PORT = 65432
 FATOR_AMPLIFICACAO_RUIDO = 150.0
 
+# Texto de detalhes do CRC-32 exibido na GUI (calculado, recebido e XOR, que evidencia os bits divergentes).
+_format_crc_details = "Calculado: 0x{:08X}  Recebido: 0x{:08X}  XOR: 0x{:08X}".format
+
 # Configuração de logging: salva em arquivo e mostra no console para depuração.
 logging.basicConfig(
     level=logging.DEBUG,
@@ -137,9 +136,11 @@ def run_receiver(update_callback):
                     logger.info("Nenhum ruído adicionado ao sinal")
 
                 # Atualiza GUI com gráfico do sinal recebido (antes da demodulação).
+                # Os dados de gráficos seguem para a GUI como np.ndarray float32 (metade da memória do float64,
+                # precisão de sobra para exibição); a demodulação continua usando o sinal original.
                 update_callback({'type': 'plot', 'tab': 'pre_demod', 'data': {
-                    't': np.arange(len(noisy_signal)) / config["sampling_rate"],
-                    'signal_real': noisy_signal,
+                    't': (np.arange(len(noisy_signal)) / config["sampling_rate"]).astype(np.float32),
+                    'signal_real': noisy_signal.astype(np.float32, copy=False),
                     'config': config
                 }})
 
@@ -161,13 +162,13 @@ def run_receiver(update_callback):
 
                 # Atualiza GUI com gráfico do sinal digital recuperado (banda base).
                 update_callback({'type': 'plot', 'tab': 'post_demod', 'data': {
-                    't': t_digital_rx,
-                    'signal': digital_signal_rx,
+                    't': t_digital_rx.astype(np.float32, copy=False),
+                    'signal': digital_signal_rx.astype(np.float32, copy=False),
                     'config': config
                 }})
 
                 # Atualiza GUI com gráfico da constelação recebida (apenas para 8-QAM).
-                if config['mod_portadora_type'] == '8-QAM' and received_qam_points:
+                if config['mod_portadora_type'] == '8-QAM' and len(received_qam_points):
                     update_callback({'type': 'plot', 'tab': 'constellation_rx', 'data': {'points': received_qam_points}})
                     logger.info("Constelação recebida com ruído enviada para plotagem.")
 
@@ -216,11 +217,12 @@ def run_receiver(update_callback):
                     logger.info(f"CRC gerado (recalculado): {crc_gerado}")
                     logger.info(f"CRC recebido: {crc_recebido}")
                     logger.info(f"Validação CRC: {'OK' if detecao_ok else 'INVÁLIDO'}")
+                    # Detalhes formatados aqui, na thread do receptor, e não a cada atualização da GUI.
+                    crc_calc, crc_recv = int(crc_gerado, 2), int(crc_recebido, 2)
                     update_callback({'type': 'detection_result', 'data': {
                         'method': 'CRC-32',
                         'status': 'OK' if detecao_ok else 'INVÁLIDO',
-                        'calc': int(crc_gerado, 2),
-                        'recv': int(crc_recebido, 2),
+                        'details': _format_crc_details(crc_calc, crc_recv, crc_calc ^ crc_recv),
                     }})
 
                 elif tipo_erro == "Paridade Par":
@@ -249,11 +251,13 @@ def run_receiver(update_callback):
                 mensagem_final = utils.binary_to_text(dados_decodificados) if detecao_ok else "ERRO: DADOS CORROMPIDOS."
 
                 # Compara mensagem transmitida vs decodificada, para estatísticas de erro final.
-                ideal_bits_str = config["message"] if all(b in '01' for b in config["message"]) else utils.text_to_binary(config["message"])
-                ideal_bits = [int(b) for b in ideal_bits_str]
-                corrected_bits = [int(b) for b in dados_decodificados]
-                min_len = min(len(ideal_bits), len(corrected_bits))
-                num_erros = sum(1 for a, b in zip(ideal_bits[:min_len], corrected_bits[:min_len]) if a != b) + abs(len(ideal_bits) - len(corrected_bits))
+                ideal_bits_str = config["message"] if utils.is_binary_string(config["message"]) else utils.text_to_binary(config["message"])
+                # Os bytes ASCII de '0' e '1' diferem só no último bit: o XOR vetorizado dos dois trechos
+                # vale 1 exatamente nas posições divergentes (sem converter cada caractere para int).
+                min_len = min(len(ideal_bits_str), len(dados_decodificados))
+                ideal_bits = np.frombuffer(ideal_bits_str[:min_len].encode('ascii'), dtype=np.uint8)
+                corrected_bits = np.frombuffer(dados_decodificados[:min_len].encode('ascii'), dtype=np.uint8)
+                num_erros = int(np.count_nonzero(ideal_bits ^ corrected_bits)) + abs(len(ideal_bits_str) - len(dados_decodificados))
                 logger.info(f"Diferenças após correção (ideal vs decodificado): {num_erros} bits diferentes")
 
                 total_time = time_module.time() - start_time
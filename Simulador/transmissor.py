@@ -1,14 +1,10 @@
 # Simulador/transmissor.py
 
 import socket
-import sys
 import numpy as np
 import time
 import logging
 
-# Permite importar módulos de outras pastas do projeto, essenciais para acesso a funcionalidades de cada camada.
-sys.path.append('../')
-
 from Utilidades import utils
 from CamadaEnlace.deteccao_erros import ErrorDetector
 from CamadaEnlace.correcao_erros import ErrorCorrector
@@ -178,13 +174,16 @@ def run_transmitter(params):
         
         # --- Camada Física: Modulação por Portadora ---
         logger.info(f"6. (Física) Preparando para modular com {mod_portadora}.")
+        if mod_portadora in ("ASK", "FSK"):
+            # Máscara dos bits '1' do quadro, lida direto dos bytes ASCII (sem laço Python por bit).
+            bit_is_one = np.frombuffer(frame_for_physical_layer.encode('ascii'), dtype=np.uint8) == ord('1')
         if mod_portadora == "ASK":
             # ASK: bit 1 vira pulso, bit 0 vira ausência de pulso (amplitude).
-            signal_source = np.array([1.0 if b == '1' else 0.0 for b in frame_for_physical_layer])
+            signal_source = bit_is_one.astype(np.float64)
             t_analog, analog_signal, *qam_points = modulator.modulate(signal_source, mod_portadora)
         elif mod_portadora == "FSK":
             # FSK: bit 1 vira onda de uma frequência, bit 0 de outra.
-            signal_source = np.array([1.0 if b == '1' else -1.0 for b in frame_for_physical_layer])
+            signal_source = np.where(bit_is_one, 1.0, -1.0)
             t_analog, analog_signal, *qam_points = modulator.modulate(signal_source, mod_portadora)
         elif mod_portadora == "Nenhum":
             signal_source_for_analog = digital_signal_plot
@@ -14,6 +14,19 @@ def text_to_binary(text):
     """
     return ''.join(format(ord(char), '08b') for char in text)
 
+def is_binary_string(text):
+    """
+    Verifica se uma string contém apenas os caracteres '0' e '1' (entrada binária pura).
+    Feita por um único str.strip em C, sem laço Python por caractere.
+
+    Args:
+        text (str): String a verificar.
+
+    Returns:
+        bool: True se a string for vazia ou composta só de '0's e '1's.
+    """
+    return not text.strip('01')
+
 def binary_to_text(binary_str):
     """
     Converte uma string de bits contínua em texto ASCII, considerando grupos de 8 bits por caractere.